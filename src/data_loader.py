@@ -1,11 +1,25 @@
+import warnings
+
 import yfinance as yf
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 
+def _fetch_one(ticker: str, start_date: str, end_date: str) -> pd.Series:
+    """Downloads the adjusted close series for a single ticker."""
+    history = yf.Ticker(ticker).history(
+        start=start_date, end=end_date, auto_adjust=True, timeout=10
+    )
+    return history['Close'].rename(ticker)
+
 def fetch_stock_data(tickers: List[str], start_date: str, end_date: str) -> pd.DataFrame:
     """
     Fetches historical stock data for the given tickers.
 
+    For larger ticker lists the per-symbol requests are dispatched across a
+    thread pool — the work is network-bound, so latencies overlap instead of
+    adding up.
+
     Args:
         tickers (List[str]): List of stock tickers (e.g., ['AAPL', 'MSFT']).
         start_date (str): Start date in 'YYYY-MM-DD' format.
@@ -16,15 +30,67 @@ def fetch_stock_data(tickers: List[str], start_date: str, end_date: str) -> pd.D
     """
     if not tickers:
         return pd.DataFrame()
-    
+
+    if len(tickers) > 4:
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+            futures = {
+                executor.submit(_fetch_one, t, start_date, end_date): t
+                for t in tickers
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    results[ticker] = future.result()
+                except (KeyError, OSError) as exc:
+                    warnings.warn(f"Failed to fetch {ticker}: {exc}")
+        if not results:
+            return pd.DataFrame()
+        return pd.concat(results, axis=1)[[t for t in tickers if t in results]]
+
     data = yf.download(tickers, start=start_date, end=end_date)['Adj Close']
-    
+
     if isinstance(data, pd.Series):
         data = data.to_frame()
         data.columns = tickers
-        
+
     return data
 
+def validate_tickers(tickers: List[str]) -> List[str]:
+    """
+    Checks which tickers resolve to live Yahoo Finance symbols.
+
+    Probes each ticker's fast_info concurrently (the lookups are
+    network-bound) and keeps only the symbols reporting a last price, so
+    invalid entries are dropped before the expensive bulk download instead
+    of coming back as all-NaN columns.
+
+    Args:
+        tickers (List[str]): Ticker symbols to check.
+
+    Returns:
+        List[str]: The subset of tickers that exist, in the original order.
+    """
+    if not tickers:
+        return []
+
+    def _is_live(ticker: str) -> bool:
+        try:
+            return yf.Ticker(ticker).fast_info["lastPrice"] is not None
+        except KeyError:
+            # Yahoo affirmatively does not know the symbol.
+            return False
+        except Exception:
+            # Transient transport failure or rate limit — fail open, so an
+            # outage can't drop every ticker and abort the whole run; bad
+            # symbols that slip through just come back as NaN columns.
+            return True
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+        live = list(executor.map(_is_live, tickers))
+
+    return [t for t, ok in zip(tickers, live) if ok]
+
 def get_ticker_info(ticker: str) -> dict:
     """
     Fetches basic information for a single ticker.
@@ -1,6 +1,17 @@
 import unittest
+import numpy as np
 import pandas as pd
-from src.analysis import calculate_returns, calculate_volatility
+from src.analysis import (
+    calculate_returns,
+    calculate_volatility,
+    simulate_efficient_frontier,
+    compute_analytic_frontier,
+    calculate_risk_measures,
+    calculate_var,
+    calculate_cvar,
+    calculate_beta,
+    calculate_max_drawdown,
+)
 
 class TestAnalysis(unittest.TestCase):
     def setUp(self):
@@ -15,6 +26,61 @@ class TestAnalysis(unittest.TestCase):
         self.assertEqual(len(returns), 4) # Should lose one row
         self.assertAlmostEqual(returns.iloc[0]['Asset_A'], 0.02)
 
+    def test_simulate_efficient_frontier(self):
+        returns = calculate_returns(self.prices)
+        sim_df, optimal = simulate_efficient_frontier(returns, num_portfolios=100, random_seed=42)
+        self.assertEqual(len(sim_df), 100)
+        self.assertIn('max_sharpe', optimal)
+        # Same seed must reproduce the same simulation
+        sim_df2, _ = simulate_efficient_frontier(returns, num_portfolios=100, random_seed=42)
+        pd.testing.assert_frame_equal(sim_df, sim_df2)
+        # Weights sum to 1
+        self.assertAlmostEqual(sum(optimal['max_sharpe']['weights'].values()), 1.0)
+
+    def test_simulate_efficient_frontier_injected_rng(self):
+        returns = calculate_returns(self.prices)
+        sim_df, _ = simulate_efficient_frontier(
+            returns, num_portfolios=50, rng=np.random.default_rng(7)
+        )
+        sim_df2, _ = simulate_efficient_frontier(
+            returns, num_portfolios=50, rng=np.random.default_rng(7)
+        )
+        pd.testing.assert_frame_equal(sim_df, sim_df2)
+
+    def test_compute_analytic_frontier(self):
+        returns = calculate_returns(self.prices)
+        frontier = compute_analytic_frontier(returns, num_points=50)
+        self.assertEqual(len(frontier), 50)
+        self.assertTrue((frontier['Volatility'] > 0).all())
+
+    def test_calculate_risk_measures(self):
+        returns = calculate_returns(self.prices)
+        measures = calculate_risk_measures(returns, confidence=0.95)
+        # Single-pass results must agree with the per-metric functions
+        pd.testing.assert_series_equal(
+            measures['VaR (Historical)'], calculate_var(returns, 0.95), check_names=False
+        )
+        pd.testing.assert_series_equal(
+            measures['CVaR'], calculate_cvar(returns, 0.95), check_names=False
+        )
+
+    def test_calculate_beta(self):
+        returns = calculate_returns(self.prices)
+        market = returns['Asset_B']
+        beta = calculate_beta(returns, market)
+        self.assertEqual(list(beta.index), list(returns.columns))
+        # Matches the pairwise definition cov(asset, market) / var(market)
+        expected = returns['Asset_A'].cov(market) / market.var()
+        self.assertAlmostEqual(beta['Asset_A'], expected)
+        self.assertAlmostEqual(beta['Asset_B'], 1.0)
+
+    def test_calculate_max_drawdown(self):
+        max_dd = calculate_max_drawdown(self.prices)
+        # Matches the cummax-based definition
+        rolling_max = self.prices.cummax()
+        expected = ((self.prices - rolling_max) / rolling_max).min()
+        pd.testing.assert_series_equal(max_dd, expected, check_names=False)
+
     def test_calculate_volatility(self):
         returns = calculate_returns(self.prices)
         vol = calculate_volatility(returns, annualized=True)